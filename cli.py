@@ -4,10 +4,12 @@ Command-line program to fetch research papers from PubMed with authors affiliate
 pharmaceutical/biotech companies.
 """
 import argparse
+import asyncio
+import logging
 import sys
 from typing import Optional
 
-from pubmed_papers import get_papers, papers_to_csv
+from pubmed_papers import ASYNC_AVAILABLE, get_papers, get_papers_async, write_papers_csv
 
 def parse_arguments() -> argparse.Namespace:
     """Parse command-line arguments.
@@ -44,24 +46,28 @@ def main() -> int:
     """
     args = parse_arguments()
     
+    # httpx logs every request at INFO; keep that out of the console output unless debugging
+    if not args.debug:
+        logging.getLogger("httpx").setLevel(logging.WARNING)
+    
     try:
-        # Get papers matching the query
-        papers = get_papers(args.query, debug=args.debug)
+        # Get papers matching the query, using the async HTTP/2 pipeline when httpx is installed
+        if ASYNC_AVAILABLE:
+            papers = asyncio.run(get_papers_async(args.query, debug=args.debug))
+        else:
+            papers = get_papers(args.query, debug=args.debug)
         
         if not papers:
             print("No papers found matching the criteria.", file=sys.stderr)
             return 1
         
-        # Convert papers to CSV
-        csv_output = papers_to_csv(papers)
-        
-        # Output results
+        # Stream papers as CSV to the output file or the console
         if args.file:
-            with open(args.file, 'w', encoding='utf-8') as f:
-                f.write(csv_output)
+            with open(args.file, 'w', encoding='utf-8', newline='') as f:
+                write_papers_csv(papers, f)
             print(f"Results saved to {args.file}")
         else:
-            print(csv_output)
+            write_papers_csv(papers, sys.stdout)
         
         return 0
         
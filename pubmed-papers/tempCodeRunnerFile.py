@@ -1 +0,0 @@
-rich.logging
\ No newline at end of file
@@ -1,8 +1,26 @@
 """
-Tool to fetch research papers from PubMed with authors affiliated with pharmaceutical/biotech companies.
+PubMed Papers - Tool to fetch research papers from PubMed with authors affiliated with 
+pharmaceutical/biotech companies.
 """
 
-from pubmed_papers.fetcher import get_papers
-from pubmed_papers.formatter import papers_to_csv
+from .client import (
+    ASYNC_AVAILABLE,
+    get_papers,
+    get_papers_async,
+    papers_to_csv,
+    write_papers_csv,
+    Paper,
+    Author,
+    PubMedClient,
+)
 
-__all__ = ["get_papers", "papers_to_csv"]
\ No newline at end of file
+__all__ = [
+    "ASYNC_AVAILABLE",
+    "get_papers",
+    "get_papers_async",
+    "papers_to_csv",
+    "write_papers_csv",
+    "Paper",
+    "Author",
+    "PubMedClient",
+]
\ No newline at end of file
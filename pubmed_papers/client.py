@@ -0,0 +1,936 @@
+"""
+Module for fetching research papers from PubMed with authors affiliated with pharmaceutical/biotech companies.
+"""
+from typing import Dict, List, Optional, Tuple, Any, TextIO
+import asyncio
+import importlib.util
+import re
+import csv
+import logging
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO, StringIO
+from dataclasses import dataclass, field
+from functools import lru_cache
+from urllib.parse import quote
+
+import requests
+from requests.adapters import HTTPAdapter
+from lxml import etree as LET
+from rich.logging import RichHandler
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # orjson is optional; fall back to the standard library
+    from json import loads as _json_loads
+
+try:
+    import httpx
+except ImportError:  # httpx is optional; only the async API needs it
+    httpx = None
+
+# Whether the async API (get_papers_async) can be used
+ASYNC_AVAILABLE = httpx is not None
+
+# HTTP/2 support in httpx needs the separate h2 package
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(message)s",
+    datefmt="[%X]",
+    handlers=[RichHandler(rich_tracebacks=True)]
+)
+logger = logging.getLogger("pubmed_papers")
+
+# Constants
+PUBMED_BASE_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils"
+PUBMED_SEARCH_URL = f"{PUBMED_BASE_URL}/esearch.fcgi"
+PUBMED_FETCH_URL = f"{PUBMED_BASE_URL}/efetch.fcgi"
+PUBMED_SUMMARY_URL = f"{PUBMED_BASE_URL}/esummary.fcgi"
+PUBMED_POST_URL = f"{PUBMED_BASE_URL}/epost.fcgi"
+
+# NCBI E-utilities request limits (requests per second)
+REQUESTS_PER_SECOND = 3
+REQUESTS_PER_SECOND_WITH_API_KEY = 10
+FETCH_BATCH_SIZE = 50
+FETCH_MAX_WORKERS = 3
+USER_AGENT = "pubmed-papers/0.1.0"
+HTTP_HEADERS = {
+    "User-Agent": USER_AGENT,
+    "Accept-Encoding": "gzip, deflate",
+}
+
+# Non-academic institution patterns
+NON_ACADEMIC_PATTERNS = [
+    r'(pharma|biotech|therapeutics|biosciences|laboratories|inc\.|corp\.|ltd\.|llc|gmbh|co\.|biopharma|biopharm)',
+    r'(?<!medical )(company|corporation)',
+    r'(?<!university )labs',
+]
+
+# Academic institution patterns to exclude
+ACADEMIC_PATTERNS = [
+    r'(university|college|institute|school|academy|medical center|medical school|hospital|clinic|foundation)',
+    r'(department|faculty|division|center for)',
+]
+
+# Each pattern list is compiled once into a single alternation
+_NON_ACAD_RE = re.compile("|".join(NON_ACADEMIC_PATTERNS), re.IGNORECASE)
+_ACAD_RE = re.compile("|".join(ACADEMIC_PATTERNS), re.IGNORECASE)
+_EMAIL_RE = re.compile(r'[\w\.-]+@[\w\.-]+')
+
+# Lowercase literals, one of which every NON_ACADEMIC_PATTERNS match contains
+_FAST_KEYS = (
+    "pharma", "biopharm", "biotech", "therapeutics", "biosciences", "laboratories",
+    "inc.", "corp", "ltd.", "llc", "gmbh", "co.", "company", "labs",
+)
+
+# Month abbreviations used in PubDate/Month mapped to two-digit month numbers
+_MONTH_MAP = {
+    name: f"{i + 1:02d}"
+    for i, name in enumerate(["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"])
+}
+
+# XML parser settings: never load the referenced PubMed DTD or resolve entities
+_XML_PARSER_OPTIONS = {
+    "resolve_entities": False,
+    "no_network": True,
+    "load_dtd": False,
+    "huge_tree": False,
+    "remove_blank_text": True,
+}
+# iterparse takes these as keyword options; fromstring reuses this one parser
+_XML_PARSER = LET.XMLParser(**_XML_PARSER_OPTIONS)
+
+@lru_cache(maxsize=4096)
+def _classify_affiliation(affiliation: str) -> bool:
+    """Classify an affiliation string as non-academic (cached per distinct string).
+    
+    Args:
+        affiliation: The affiliation string.
+        
+    Returns:
+        True if the affiliation is non-academic, False otherwise.
+    """
+    # Academic matches are the common case, so rule them out first
+    return not _ACAD_RE.search(affiliation) and bool(_NON_ACAD_RE.search(affiliation))
+
+# Slotted dataclasses need Python 3.10+; older interpreters fall back to __dict__
+_DATACLASS_OPTIONS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_OPTIONS)
+class Author:
+    """Data class to store author information."""
+    name: str
+    affiliation: str
+    email: Optional[str] = None
+    is_corresponding: bool = False
+    is_non_academic: bool = False
+
+@dataclass(**_DATACLASS_OPTIONS)
+class Paper:
+    """Data class to store paper information."""
+    pubmed_id: str
+    title: str
+    publication_date: str
+    authors: List[Author]
+    non_academic_authors: List[Author]
+    # Derived from the author lists once, when the paper is created
+    corresponding_author_email: Optional[str] = field(init=False, repr=False, compare=False, default=None)
+    company_affiliations: List[str] = field(init=False, repr=False, compare=False, default_factory=list)
+    
+    def __post_init__(self) -> None:
+        """Compute the corresponding author email and unique company affiliations."""
+        for author in self.authors:
+            if author.is_corresponding and author.email:
+                self.corresponding_author_email = author.email
+                break
+        self.company_affiliations = list(dict.fromkeys(author.affiliation for author in self.non_academic_authors))
+
+
+@dataclass(**_DATACLASS_OPTIONS)
+class _SearchHistory:
+    """Reference to a list of PubMed IDs held on the E-utilities history server."""
+    webenv: str
+    query_key: str
+    paper_ids: List[str]
+
+
+class _RateLimiter:
+    """Thread-safe gate spacing outgoing requests at least 1/rate seconds apart."""
+    
+    def __init__(self, rate: float):
+        """Initialize the rate limiter.
+        
+        Args:
+            rate: Maximum number of requests per second.
+        """
+        self.rate = rate
+        self._interval = 1 / rate
+        self._next_allowed = 0.0
+        self._lock = threading.Lock()
+    
+    def _reserve(self) -> float:
+        """Reserve the next free send slot.
+        
+        Returns:
+            Seconds to wait before sending in the reserved slot.
+        """
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_allowed)
+            self._next_allowed = slot + self._interval
+        return slot - now
+    
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+    
+    async def acquire_async(self) -> None:
+        """Wait, without blocking the event loop, until a request may be sent."""
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+class PubMedClient:
+    """Client for interacting with the PubMed API."""
+    
+    def __init__(self, debug: bool = False, api_key: Optional[str] = None):
+        """Initialize the PubMed client.
+        
+        Args:
+            debug: Whether to enable debug logging.
+            api_key: Optional NCBI API key, which raises the request limit.
+        """
+        self.debug = debug
+        self.api_key = api_key
+        self._rate_limiter = _RateLimiter(
+            REQUESTS_PER_SECOND_WITH_API_KEY if api_key else REQUESTS_PER_SECOND
+        )
+        
+        # One keep-alive session shared by all requests, including fetch workers
+        self._session = requests.Session()
+        self._session.headers.update(HTTP_HEADERS)
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10)
+        self._session.mount("https://", adapter)
+        
+        # History server reference for the most recent search
+        self._history: Optional[_SearchHistory] = None
+        if debug:
+            logger.setLevel(logging.DEBUG)
+    
+    def _with_api_key(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Add the API key, if any, to request parameters.
+        
+        Args:
+            params: Request parameters.
+        
+        Returns:
+            Parameters including the API key.
+        """
+        if self.api_key:
+            return {**params, "api_key": self.api_key}
+        return params
+    
+    def _get(self, url: str, params: Dict[str, Any]) -> requests.Response:
+        """Send a rate-limited GET request to an E-utilities endpoint.
+        
+        Args:
+            url: The endpoint URL.
+            params: Query parameters for the request.
+        
+        Returns:
+            The HTTP response.
+        """
+        self._rate_limiter.acquire()
+        return self._session.get(url, params=self._with_api_key(params))
+    
+    def _post(self, url: str, data: Dict[str, Any]) -> requests.Response:
+        """Send a rate-limited POST request to an E-utilities endpoint.
+        
+        Args:
+            url: The endpoint URL.
+            data: Form parameters for the request.
+        
+        Returns:
+            The HTTP response.
+        """
+        self._rate_limiter.acquire()
+        return self._session.post(url, data=self._with_api_key(data))
+    
+    def search_papers(self, query: str, max_results: int = 100) -> List[str]:
+        """Search for papers matching the query.
+        
+        Args:
+            query: The search query using PubMed query syntax.
+            max_results: Maximum number of results to return.
+        
+        Returns:
+            List of PubMed IDs.
+        """
+        logger.debug(f"Searching for papers with query: {query}")
+        
+        try:
+            response = self._get(PUBMED_SEARCH_URL, self._search_params(query, max_results))
+            response.raise_for_status()
+        except requests.RequestException as e:
+            logger.error(f"Error searching PubMed: {e}")
+            return []
+        
+        return self._handle_search_response(response.content)
+    
+    def _search_params(self, query: str, max_results: int) -> Dict[str, Any]:
+        """Build esearch parameters.
+        
+        Args:
+            query: The search query using PubMed query syntax.
+            max_results: Maximum number of results to return.
+        
+        Returns:
+            Query parameters for esearch.
+        """
+        return {
+            "db": "pubmed",
+            "term": query,
+            "retmode": "json",
+            "retmax": max_results,
+            "usehistory": "y",
+        }
+    
+    def _handle_search_response(self, content: bytes) -> List[str]:
+        """Decode an esearch response and remember its history server entry.
+        
+        Args:
+            content: Raw JSON response body.
+        
+        Returns:
+            List of PubMed IDs.
+        """
+        try:
+            data = _json_loads(content)
+        except ValueError as e:
+            logger.error(f"Error decoding search response: {e}")
+            return []
+        
+        if "esearchresult" not in data or "idlist" not in data["esearchresult"]:
+            logger.warning("No search results found or unexpected API response format")
+            return []
+        
+        result = data["esearchresult"]
+        paper_ids = result["idlist"]
+        logger.debug(f"Found {len(paper_ids)} papers")
+        
+        # Keep the server-side result set so efetch need not resend the IDs
+        if "webenv" in result and "querykey" in result:
+            self._history = _SearchHistory(
+                webenv=result["webenv"],
+                query_key=result["querykey"],
+                paper_ids=paper_ids,
+            )
+        return paper_ids
+    
+    def _history_for(self, paper_ids: List[str]) -> Optional[_SearchHistory]:
+        """Return the last search's history entry if it holds exactly these IDs.
+        
+        Args:
+            paper_ids: List of PubMed IDs.
+        
+        Returns:
+            The matching history entry, or None.
+        """
+        history = self._history
+        if history is not None and history.paper_ids == paper_ids:
+            return history
+        return None
+    
+    def fetch_paper_details(self, paper_ids: List[str]) -> List[Paper]:
+        """Fetch detailed information for the given paper IDs.
+        
+        Args:
+            paper_ids: List of PubMed IDs.
+        
+        Returns:
+            List of Paper objects.
+        """
+        if not paper_ids:
+            return []
+        
+        logger.debug(f"Fetching details for {len(paper_ids)} papers")
+        
+        # Reuse the last search's history entry, or upload these IDs with epost
+        history = self._history_for(paper_ids) or self._post_ids(paper_ids)
+        if history is None:
+            return []
+        
+        # Process in batches to avoid API limitations, fetching them concurrently
+        def fetch(retstart: int) -> List[Paper]:
+            retmax = min(FETCH_BATCH_SIZE, len(paper_ids) - retstart)
+            return self._fetch_batch(history.webenv, history.query_key, retstart, retmax)
+        
+        with ThreadPoolExecutor(max_workers=FETCH_MAX_WORKERS) as executor:
+            results = list(executor.map(fetch, range(0, len(paper_ids), FETCH_BATCH_SIZE)))
+        
+        return [paper for batch_papers in results for paper in batch_papers]
+    
+    def _post_ids(self, paper_ids: List[str]) -> Optional[_SearchHistory]:
+        """Upload PubMed IDs to the history server with epost.
+        
+        Args:
+            paper_ids: List of PubMed IDs.
+        
+        Returns:
+            History server reference for the IDs, or None on failure.
+        """
+        try:
+            response = self._post(PUBMED_POST_URL, {"db": "pubmed", "id": ",".join(paper_ids)})
+            response.raise_for_status()
+        except requests.RequestException as e:
+            logger.error(f"Error posting IDs to PubMed: {e}")
+            return None
+        
+        return self._handle_post_response(response.content, paper_ids)
+    
+    def _handle_post_response(self, content: bytes, paper_ids: List[str]) -> Optional[_SearchHistory]:
+        """Parse an epost response into a history server reference.
+        
+        Args:
+            content: Raw XML response body.
+            paper_ids: The PubMed IDs that were posted.
+        
+        Returns:
+            History server reference for the IDs, or None on failure.
+        """
+        try:
+            root = LET.fromstring(content, parser=_XML_PARSER)
+        except LET.XMLSyntaxError as e:
+            logger.error(f"Error parsing epost response: {e}")
+            return None
+        
+        webenv = root.findtext("WebEnv")
+        query_key = root.findtext("QueryKey")
+        if not webenv or not query_key:
+            logger.error("Unexpected epost response: missing WebEnv or QueryKey")
+            return None
+        
+        return _SearchHistory(webenv=webenv, query_key=query_key, paper_ids=list(paper_ids))
+    
+    def _fetch_batch(self, webenv: str, query_key: str, retstart: int, retmax: int) -> List[Paper]:
+        """Fetch a batch of paper details from the PubMed history server.
+        
+        Args:
+            webenv: History server WebEnv identifier.
+            query_key: Query key of the result set within the WebEnv.
+            retstart: Index of the first record in the batch.
+            retmax: Number of records in the batch.
+        
+        Returns:
+            List of Paper objects.
+        """
+        try:
+            response = self._get(PUBMED_FETCH_URL, self._fetch_params(webenv, query_key, retstart, retmax))
+            response.raise_for_status()
+        except requests.RequestException as e:
+            logger.error(f"Error fetching paper details: {e}")
+            return []
+        
+        logger.debug(f"efetch response Content-Encoding: {response.headers.get('Content-Encoding', 'identity')}")
+        return self._parse_xml_response(response.content)
+    
+    def _fetch_params(self, webenv: str, query_key: str, retstart: int, retmax: int) -> Dict[str, Any]:
+        """Build efetch parameters for one batch of a history server result set.
+        
+        Args:
+            webenv: History server WebEnv identifier.
+            query_key: Query key of the result set within the WebEnv.
+            retstart: Index of the first record in the batch.
+            retmax: Number of records in the batch.
+        
+        Returns:
+            Query parameters for efetch.
+        """
+        return {
+            "db": "pubmed",
+            "WebEnv": webenv,
+            "query_key": query_key,
+            "retstart": retstart,
+            "retmax": retmax,
+            "retmode": "xml",
+            "rettype": "abstract",
+        }
+    
+    def create_async_http_client(self) -> "httpx.AsyncClient":
+        """Create an httpx client for the async API, using HTTP/2 when available.
+        
+        Returns:
+            A configured httpx.AsyncClient, to be used as an async context manager.
+        
+        Raises:
+            ImportError: If httpx is not installed.
+        """
+        if httpx is None:
+            raise ImportError("The async API requires httpx (install the 'async' extra)")
+        return httpx.AsyncClient(
+            http2=_HTTP2_AVAILABLE,
+            headers=HTTP_HEADERS,
+            limits=httpx.Limits(max_connections=10),
+        )
+    
+    async def _post_async(self, http: "httpx.AsyncClient", url: str, data: Dict[str, Any]) -> "httpx.Response":
+        """Send a rate-limited async POST request to an E-utilities endpoint.
+        
+        The async path sends every request as a POST, so that parameters such
+        as the API key travel in the body and not in the URLs httpx logs.
+        
+        Args:
+            http: The httpx client to send the request with.
+            url: The endpoint URL.
+            data: Form parameters for the request.
+        
+        Returns:
+            The HTTP response.
+        """
+        await self._rate_limiter.acquire_async()
+        return await http.post(url, data=self._with_api_key(data))
+    
+    async def search_papers_async(self, http: "httpx.AsyncClient", query: str, max_results: int = 100) -> List[str]:
+        """Search for papers matching the query, asynchronously.
+        
+        Args:
+            http: The httpx client from create_async_http_client.
+            query: The search query using PubMed query syntax.
+            max_results: Maximum number of results to return.
+        
+        Returns:
+            List of PubMed IDs.
+        """
+        logger.debug(f"Searching for papers with query: {query}")
+        
+        try:
+            response = await self._post_async(http, PUBMED_SEARCH_URL, self._search_params(query, max_results))
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            logger.error(f"Error searching PubMed: {e}")
+            return []
+        
+        return self._handle_search_response(response.content)
+    
+    async def fetch_paper_details_async(self, http: "httpx.AsyncClient", paper_ids: List[str]) -> List[Paper]:
+        """Fetch detailed information for the given paper IDs, asynchronously.
+        
+        Args:
+            http: The httpx client from create_async_http_client.
+            paper_ids: List of PubMed IDs.
+        
+        Returns:
+            List of Paper objects.
+        """
+        if not paper_ids:
+            return []
+        
+        logger.debug(f"Fetching details for {len(paper_ids)} papers")
+        
+        history = self._history_for(paper_ids) or await self._post_ids_async(http, paper_ids)
+        if history is None:
+            return []
+        
+        # Batches are requested concurrently, at most FETCH_MAX_WORKERS at a time
+        semaphore = asyncio.Semaphore(FETCH_MAX_WORKERS)
+        
+        async def fetch(retstart: int) -> List[Paper]:
+            retmax = min(FETCH_BATCH_SIZE, len(paper_ids) - retstart)
+            async with semaphore:
+                return await self._fetch_batch_async(http, history.webenv, history.query_key, retstart, retmax)
+        
+        results = await asyncio.gather(*(fetch(i) for i in range(0, len(paper_ids), FETCH_BATCH_SIZE)))
+        return [paper for batch_papers in results for paper in batch_papers]
+    
+    async def _post_ids_async(self, http: "httpx.AsyncClient", paper_ids: List[str]) -> Optional[_SearchHistory]:
+        """Upload PubMed IDs to the history server with epost, asynchronously.
+        
+        Args:
+            http: The httpx client to send the request with.
+            paper_ids: List of PubMed IDs.
+        
+        Returns:
+            History server reference for the IDs, or None on failure.
+        """
+        try:
+            response = await self._post_async(http, PUBMED_POST_URL, {"db": "pubmed", "id": ",".join(paper_ids)})
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            logger.error(f"Error posting IDs to PubMed: {e}")
+            return None
+        
+        return self._handle_post_response(response.content, paper_ids)
+    
+    async def _fetch_batch_async(self, http: "httpx.AsyncClient", webenv: str, query_key: str, retstart: int, retmax: int) -> List[Paper]:
+        """Fetch a batch of paper details from the PubMed history server, asynchronously.
+        
+        Args:
+            http: The httpx client to send the request with.
+            webenv: History server WebEnv identifier.
+            query_key: Query key of the result set within the WebEnv.
+            retstart: Index of the first record in the batch.
+            retmax: Number of records in the batch.
+        
+        Returns:
+            List of Paper objects.
+        """
+        try:
+            response = await self._post_async(http, PUBMED_FETCH_URL, self._fetch_params(webenv, query_key, retstart, retmax))
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            logger.error(f"Error fetching paper details: {e}")
+            return []
+        
+        logger.debug(f"efetch response {response.http_version}, Content-Encoding: {response.headers.get('Content-Encoding', 'identity')}")
+        return self._parse_xml_response(response.content)
+
+    def _parse_xml_response(self, xml_bytes: bytes) -> List[Paper]:
+        """Parse the XML response from PubMed.
+        
+        Articles are streamed with ``iterparse`` and cleared as soon as they
+        are parsed, so the full document tree is never held in memory.
+        
+        Args:
+            xml_bytes: Raw XML response body.
+            
+        Returns:
+            List of Paper objects.
+        """
+        papers = []
+        
+        try:
+            context = LET.iterparse(
+                BytesIO(xml_bytes),
+                events=("end",),
+                tag="PubmedArticle",
+                **_XML_PARSER_OPTIONS,
+            )
+            
+            for _, article in context:
+                try:
+                    paper = self._parse_article(article)
+                    if paper:
+                        papers.append(paper)
+                except Exception as e:
+                    pmid = article.find("MedlineCitation/PMID")
+                    pmid_text = pmid.text if pmid is not None else "unknown"
+                    logger.error(f"Error parsing article (PMID: {pmid_text}): {e}")
+                finally:
+                    # Free the parsed article and any already-processed siblings
+                    article.clear()
+                    while article.getprevious() is not None:
+                        del article.getparent()[0]
+                    
+        except LET.XMLSyntaxError as e:
+            logger.error(f"Error parsing XML response: {e}")
+        
+        return papers
+    
+    def _parse_article(self, article_element: LET._Element) -> Optional[Paper]:
+        """Parse a single PubmedArticle element.
+        
+        Args:
+            article_element: The PubmedArticle XML element.
+            
+        Returns:
+            Paper object if parsing is successful, None otherwise.
+        """
+        # Extract PMID
+        pmid_elem = article_element.find("MedlineCitation/PMID")
+        if pmid_elem is None:
+            logger.warning("Article missing PMID, skipping")
+            return None
+        
+        pubmed_id = pmid_elem.text
+        
+        # Extract title
+        title_elem = article_element.find("MedlineCitation/Article/ArticleTitle")
+        title = title_elem.text if title_elem is not None else "No title available"
+        
+        # Extract publication date
+        pub_date = self._extract_publication_date(article_element)
+        
+        # Extract authors
+        authors = self._extract_authors(article_element)
+        
+        # Filter non-academic authors
+        non_academic_authors = [author for author in authors if author.is_non_academic]
+        
+        # Only include papers with at least one non-academic author
+        if not non_academic_authors:
+            logger.debug(f"PMID {pubmed_id}: No non-academic authors found, skipping")
+            return None
+        
+        return Paper(
+            pubmed_id=pubmed_id,
+            title=title,
+            publication_date=pub_date,
+            authors=authors,
+            non_academic_authors=non_academic_authors
+        )
+    
+    def _extract_publication_date(self, article_element: LET._Element) -> str:
+        """Extract the publication date from the article.
+        
+        Args:
+            article_element: The PubmedArticle XML element.
+            
+        Returns:
+            Formatted publication date string.
+        """
+        # Try PubDate first
+        pub_date_elem = article_element.find("MedlineCitation/Article/Journal/JournalIssue/PubDate")
+        if pub_date_elem is not None:
+            year_elem = pub_date_elem.find("Year")
+            month_elem = pub_date_elem.find("Month")
+            day_elem = pub_date_elem.find("Day")
+            
+            year = year_elem.text if year_elem is not None else ""
+            month = month_elem.text if month_elem is not None else ""
+            day = day_elem.text if day_elem is not None else ""
+            
+            # Convert month name to number if needed
+            if month.isalpha():
+                month = _MONTH_MAP.get(month[:3].capitalize(), "")
+            
+            if year and month and day:
+                return f"{year}-{month.zfill(2)}-{day.zfill(2)}"
+            elif year and month:
+                return f"{year}-{month.zfill(2)}"
+            elif year:
+                return year
+            
+            # Fallback to MedlineDate
+            medline_date_elem = pub_date_elem.find("MedlineDate")
+            if medline_date_elem is not None and medline_date_elem.text:
+                return medline_date_elem.text
+        
+        return "Unknown date"
+    
+    def _extract_authors(self, article_element: LET._Element) -> List[Author]:
+        """Extract authors and their affiliations from the article.
+        
+        Args:
+            article_element: The PubmedArticle XML element.
+            
+        Returns:
+            List of Author objects.
+        """
+        authors = []
+        author_list = article_element.find("MedlineCitation/Article/AuthorList")
+        
+        if author_list is None:
+            return authors
+        
+        for author_elem in author_list.findall("Author"):
+            # Collect the name and affiliation fields in a single pass over the children
+            last_name = fore_name = initials = collective_name = None
+            info_affiliation = direct_affiliation = None
+            for child in author_elem:
+                tag = child.tag
+                if tag == "LastName":
+                    last_name = child.text
+                elif tag == "ForeName":
+                    fore_name = child.text
+                elif tag == "Initials":
+                    initials = child.text
+                elif tag == "CollectiveName":
+                    collective_name = child.text
+                elif tag == "AffiliationInfo":
+                    if info_affiliation is None:
+                        affiliation_elem = child.find("Affiliation")
+                        if affiliation_elem is not None:
+                            info_affiliation = affiliation_elem.text or ""
+                elif tag == "Affiliation":
+                    if direct_affiliation is None:
+                        direct_affiliation = child.text or ""
+            
+            name_parts = []
+            if last_name:
+                name_parts.append(last_name)
+            if fore_name:
+                name_parts.append(fore_name)
+            elif initials:
+                name_parts.append(initials)
+            
+            # Handle collective author name
+            if not name_parts and collective_name:
+                name_parts.append(collective_name)
+            
+            name = " ".join(reversed(name_parts)) if name_parts else "Unknown Author"
+            
+            # Prefer the new format (AffiliationInfo) over the old direct Affiliation
+            affiliation = info_affiliation or direct_affiliation or ""
+            
+            # Extract email (if available) and check if corresponding author
+            email, is_corresponding = self._extract_email_and_correspondence(author_elem, article_element, affiliation)
+            
+            authors.append(Author(
+                name=name,
+                affiliation=affiliation,
+                email=email,
+                is_corresponding=is_corresponding,
+                is_non_academic=bool(affiliation) and self._is_non_academic_affiliation(affiliation)
+            ))
+        
+        # If no clear corresponding author, try to infer from other metadata
+        if not any(author.is_corresponding for author in authors) and authors:
+            # Try to find correspondence info in article
+            correspondence_elem = article_element.find("MedlineCitation/Article/Correspondence")
+            if correspondence_elem is not None and correspondence_elem.text:
+                # Try to match email in correspondence to an author
+                email_match = _EMAIL_RE.search(correspondence_elem.text)
+                if email_match:
+                    email = email_match.group(0)
+                    # Update the first author if no matches
+                    authors[0].email = email
+                    authors[0].is_corresponding = True
+            else:
+                # Default to first author as corresponding if nothing else
+                authors[0].is_corresponding = True
+        
+        return authors
+    
+    def _extract_email_and_correspondence(self, author_elem: LET._Element, article_element: LET._Element, affiliation: str) -> Tuple[Optional[str], bool]:
+        """Extract email and check if the author is the corresponding author.
+        
+        Args:
+            author_elem: The Author XML element.
+            article_element: The full PubmedArticle XML element.
+            affiliation: The author's affiliation, as already extracted.
+            
+        Returns:
+            Tuple of (email, is_corresponding)
+        """
+        email = None
+        is_corresponding = False
+        
+        # Check for email in affiliation text (a plain substring test skips the regex for most authors)
+        if affiliation and "@" in affiliation:
+            email_match = _EMAIL_RE.search(affiliation)
+            if email_match:
+                email = email_match.group(0)
+                # If email is in affiliation, likely a corresponding author
+                is_corresponding = True
+        
+        # Check EqualContrib attribute (some articles use this)
+        equal_contrib = author_elem.get("EqualContrib")
+        if equal_contrib and equal_contrib.lower() == "yes":
+            is_corresponding = True
+        
+        # Check CorrespAuthor attribute
+        corresp_author = author_elem.get("CorrespAuthor")
+        if corresp_author and corresp_author.lower() == "yes":
+            is_corresponding = True
+        
+        return email, is_corresponding
+    
+    def _is_non_academic_affiliation(self, affiliation: str) -> bool:
+        """Determine if the affiliation is a non-academic institution.
+        
+        Args:
+            affiliation: The affiliation string.
+            
+        Returns:
+            True if the affiliation is non-academic, False otherwise.
+        """
+        # Most affiliations contain none of the non-academic keywords; skip the regexes for them
+        affiliation_lower = affiliation.lower()
+        if not any(key in affiliation_lower for key in _FAST_KEYS):
+            return False
+        return _classify_affiliation(affiliation)
+
+
+def get_papers(query: str, debug: bool = False, api_key: Optional[str] = None) -> List[Paper]:
+    """Search for papers and filter for those with non-academic authors.
+    
+    Args:
+        query: The search query.
+        debug: Whether to enable debug logging.
+        api_key: Optional NCBI API key.
+        
+    Returns:
+        List of Paper objects meeting the criteria.
+    """
+    client = PubMedClient(debug=debug, api_key=api_key)
+    paper_ids = client.search_papers(query)
+    papers = client.fetch_paper_details(paper_ids)
+    
+    logger.info(f"Found {len(papers)} papers with non-academic authors")
+    return papers
+
+
+async def get_papers_async(query: str, debug: bool = False, api_key: Optional[str] = None) -> List[Paper]:
+    """Search for papers and filter for those with non-academic authors, asynchronously.
+    
+    Requires httpx; batches are fetched concurrently over a single HTTP/2
+    connection when the h2 package is available.
+    
+    Args:
+        query: The search query.
+        debug: Whether to enable debug logging.
+        api_key: Optional NCBI API key.
+        
+    Returns:
+        List of Paper objects meeting the criteria.
+    """
+    client = PubMedClient(debug=debug, api_key=api_key)
+    async with client.create_async_http_client() as http:
+        paper_ids = await client.search_papers_async(http, query)
+        papers = await client.fetch_paper_details_async(http, paper_ids)
+    
+    logger.info(f"Found {len(papers)} papers with non-academic authors")
+    return papers
+
+
+def write_papers_csv(papers: List[Paper], out: TextIO) -> None:
+    """Write papers as CSV rows directly to a file-like object.
+    
+    Args:
+        papers: List of Paper objects.
+        out: Text stream to write the CSV to.
+    """
+    writer = csv.writer(out)
+    
+    # Write header
+    writer.writerow([
+        "PubmedID", 
+        "Title", 
+        "Publication Date", 
+        "Non-academic Author(s)", 
+        "Company Affiliation(s)", 
+        "Corresponding Author Email"
+    ])
+    
+    # Write data rows
+    for paper in papers:
+        writer.writerow([
+            paper.pubmed_id,
+            paper.title,
+            paper.publication_date,
+            "; ".join(author.name for author in paper.non_academic_authors),
+            "; ".join(paper.company_affiliations),
+            paper.corresponding_author_email or ""
+        ])
+
+
+def papers_to_csv(papers: List[Paper]) -> str:
+    """Convert papers to CSV format.
+    
+    Args:
+        papers: List of Paper objects.
+        
+    Returns:
+        CSV formatted string.
+    """
+    output = StringIO()
+    write_papers_csv(papers, output)
+    return output.getvalue()
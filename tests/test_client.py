@@ -0,0 +1,203 @@
+"""Tests for the PubMed client."""
+import asyncio
+import json
+import time
+from typing import Any, Dict, List, Tuple
+
+import pytest
+
+from pubmed_papers.client import (
+    FETCH_MAX_WORKERS,
+    PubMedClient,
+    _RateLimiter,
+    _classify_affiliation,
+)
+
+EFETCH_XML = b"""<?xml version="1.0"?>
+<PubmedArticleSet>
+<PubmedArticle>
+  <MedlineCitation>
+    <PMID>1</PMID>
+    <Article>
+      <ArticleTitle>Drug X trial</ArticleTitle>
+      <AuthorList>
+        <Author><LastName>Smith</LastName><ForeName>John</ForeName>
+          <AffiliationInfo><Affiliation>Genentech Inc., South San Francisco</Affiliation></AffiliationInfo></Author>
+      </AuthorList>
+    </Article>
+  </MedlineCitation>
+</PubmedArticle>
+</PubmedArticleSet>"""
+
+EPOST_XML = b"<ePostResult><QueryKey>7</QueryKey><WebEnv>POSTED</WebEnv></ePostResult>"
+
+
+def esearch_json(paper_ids: List[str]) -> bytes:
+    return json.dumps({
+        "esearchresult": {"idlist": paper_ids, "webenv": "SEARCHED", "querykey": "1"}
+    }).encode()
+
+
+class StubResponse:
+    """Minimal stand-in for requests.Response."""
+    
+    def __init__(self, content: bytes):
+        self.content = content
+        self.headers: Dict[str, str] = {}
+    
+    def raise_for_status(self) -> None:
+        pass
+
+
+class StubSession:
+    """Records requests and answers them like the E-utilities endpoints."""
+    
+    def __init__(self, search_ids: List[str], epost_response: bytes = EPOST_XML):
+        self.search_ids = search_ids
+        self.epost_response = epost_response
+        self.calls: List[Tuple[str, str, Dict[str, Any]]] = []
+    
+    def get(self, url: str, params: Dict[str, Any]) -> StubResponse:
+        endpoint = url.rsplit("/", 1)[1]
+        self.calls.append(("GET", endpoint, params))
+        if endpoint == "esearch.fcgi":
+            return StubResponse(esearch_json(self.search_ids))
+        return StubResponse(EFETCH_XML)
+    
+    def post(self, url: str, data: Dict[str, Any]) -> StubResponse:
+        self.calls.append(("POST", url.rsplit("/", 1)[1], data))
+        return StubResponse(self.epost_response)
+
+
+def make_client(session: StubSession, api_key: Any = None) -> PubMedClient:
+    client = PubMedClient(api_key=api_key)
+    client._session = session
+    client._rate_limiter = _RateLimiter(10000)
+    return client
+
+# One affiliation per literal in NON_ACADEMIC_PATTERNS, with no academic keywords
+NON_ACADEMIC_AFFILIATIONS = [
+    "Acme Pharma, Basel",
+    "Genentech Biotech, South San Francisco",
+    "Foo Therapeutics, Boston",
+    "Bar Biosciences, Cambridge",
+    "Baz Laboratories, Princeton",
+    "Acme Inc., New York",
+    "Acme Corp., Chicago",
+    "Acme Ltd., London",
+    "Acme LLC, Austin",
+    "Acme GmbH, Berlin",
+    "Takeda Co., Tokyo",
+    "Zhejiang Hisun Biopharm, Taizhou",
+    "Acme Biopharm, Shanghai, China",
+    "Sino Biopharm",
+    "Eli Lilly and Company, Indianapolis",
+    "Acme Corporation, Osaka",
+    "Acme Labs, Palo Alto",
+]
+
+
+@pytest.mark.parametrize("affiliation", NON_ACADEMIC_AFFILIATIONS)
+def test_fast_key_prefilter_agrees_with_classifier(affiliation: str) -> None:
+    assert _classify_affiliation(affiliation)
+    assert PubMedClient()._is_non_academic_affiliation(affiliation)
+
+
+def test_academic_affiliation_is_not_non_academic() -> None:
+    affiliation = "Department of Biology, University of Oxford"
+    assert not PubMedClient()._is_non_academic_affiliation(affiliation)
+
+
+def test_rate_limiter_spaces_requests() -> None:
+    limiter = _RateLimiter(20)
+    times = []
+    for _ in range(5):
+        limiter.acquire()
+        times.append(time.monotonic())
+    
+    gaps = [later - earlier for earlier, later in zip(times, times[1:])]
+    assert all(gap >= 0.05 - 0.005 for gap in gaps)
+
+
+def test_fetch_reuses_search_history() -> None:
+    session = StubSession([str(i) for i in range(120)])
+    client = make_client(session)
+    
+    paper_ids = client.search_papers("cancer")
+    papers = client.fetch_paper_details(paper_ids)
+    
+    assert len(papers) == 3
+    assert not [call for call in session.calls if call[1] == "epost.fcgi"]
+    batches = sorted(
+        (params["retstart"], params["retmax"])
+        for _, endpoint, params in session.calls
+        if endpoint == "efetch.fcgi"
+    )
+    assert batches == [(0, 50), (50, 50), (100, 20)]
+    assert all(
+        params["WebEnv"] == "SEARCHED" and params["query_key"] == "1"
+        for _, endpoint, params in session.calls
+        if endpoint == "efetch.fcgi"
+    )
+
+
+def test_fetch_posts_ids_not_from_last_search() -> None:
+    session = StubSession(["1", "2", "3"])
+    client = make_client(session)
+    client.search_papers("cancer")
+    
+    papers = client.fetch_paper_details(["4", "5"])
+    
+    assert len(papers) == 1
+    assert session.calls[1] == ("POST", "epost.fcgi", {"db": "pubmed", "id": "4,5"})
+    efetch_params = session.calls[2][2]
+    assert (efetch_params["WebEnv"], efetch_params["query_key"]) == ("POSTED", "7")
+    assert (efetch_params["retstart"], efetch_params["retmax"]) == (0, 2)
+
+
+@pytest.mark.parametrize("epost_response", [
+    b"<ePostResult><WebEnv>POSTED</WebEnv></ePostResult>",
+    b"<ePostResult><ERROR>Invalid</ERROR></ePostResult>",
+    b"not xml",
+])
+def test_fetch_returns_nothing_when_epost_fails(epost_response: bytes) -> None:
+    session = StubSession([], epost_response=epost_response)
+    client = make_client(session)
+    
+    assert client.fetch_paper_details(["4", "5"]) == []
+    assert [call[1] for call in session.calls] == ["epost.fcgi"]
+
+
+def test_async_pipeline_sends_api_key_in_post_body() -> None:
+    httpx = pytest.importorskip("httpx")
+    requests_seen: List[Any] = []
+    in_flight = 0
+    max_in_flight = 0
+    
+    async def handler(request: Any) -> Any:
+        nonlocal in_flight, max_in_flight
+        requests_seen.append(request)
+        endpoint = request.url.path.rsplit("/", 1)[1]
+        if endpoint == "esearch.fcgi":
+            return httpx.Response(200, content=esearch_json([str(i) for i in range(400)]))
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, content=EFETCH_XML)
+    
+    async def run() -> List[Any]:
+        client = PubMedClient(api_key="SECRET")
+        client._rate_limiter = _RateLimiter(10000)
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+            paper_ids = await client.search_papers_async(http, "cancer")
+            return await client.fetch_paper_details_async(http, paper_ids)
+    
+    papers = asyncio.run(run())
+    
+    assert len(papers) == 8
+    assert 1 < max_in_flight <= FETCH_MAX_WORKERS
+    for request in requests_seen:
+        assert request.method == "POST"
+        assert "SECRET" not in str(request.url)
+        assert b"api_key=SECRET" in request.content